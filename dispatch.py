@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# A lightweight dispatcher that posts the bot's scheduled tweets.
+#
+# script.py decides how many tweets to post each day, generates them, posts
+# the first one and writes the rest, with their send times, to schedule.json
+# before exiting.
+# This script is run every few minutes by cron. It only uses the standard
+# library, so it starts quickly and stays small. It imports script.py (and
+# its heavier libraries) only when a tweet is actually due.
+#
+# ====================================================================
+# Cron setup
+# ====================================================================
+# Add an entry like the following with `crontab -e`:
+#
+# */5 * * * * cd /home/vlad/Desktop/twitter-bot && /usr/bin/python3 dispatch.py >> cron.log 2>&1
+#
+
+import json
+import time
+from pathlib import Path
+
+# The file holding the pending tweets and their send times (Unix timestamps).
+SCHEDULE_PATH = Path(__file__).resolve().parent / "schedule.json"
+
+def load_schedule():
+    """
+    Reads the pending tweets from the schedule file.
+
+    Returns:
+        list: Dicts with the 'send_at' timestamp, 'text', 'cache_key' and
+            'created_at' (generation time) of each tweet still to be posted,
+            earliest first.
+    """
+    try:
+        with open(SCHEDULE_PATH) as f:
+            return sorted(json.load(f), key=lambda entry: entry["send_at"])
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        return []
+
+def save_schedule(schedule):
+    """
+    Writes the pending tweets to the schedule file.
+
+    Args:
+        schedule (list): Dicts with the 'send_at' timestamp, 'text', 'cache_key'
+            and 'created_at' (generation time) of each tweet still to be posted.
+    """
+    with open(SCHEDULE_PATH, "w") as f:
+        json.dump(sorted(schedule, key=lambda entry: entry["send_at"]), f)
+
+def dispatch_due_tweet():
+    """
+    Posts the next scheduled tweet if its send time has passed.
+    At most one tweet is posted per run so that missed runs don't cause a burst.
+    """
+    schedule = load_schedule()
+    if not schedule or schedule[0]["send_at"] > time.time():
+        return
+
+    # Remove the entry before posting so a slow post is never picked up twice.
+    entry = schedule[0]
+    save_schedule(schedule[1:])
+    print(f"Dispatching tweet scheduled for {time.ctime(entry['send_at'])}.")
+
+    import script
+    if not script.post_tweet(entry["text"]) and "created_at" in entry:
+        # Keep the generated text for reuse instead of losing it.
+        script.cache_unposted_tweet(entry.get("cache_key"), entry["text"], entry["created_at"])
+
+if __name__ == "__main__":
+    dispatch_due_tweet()
@@ -5,9 +5,10 @@
 #
 # This script requires a Twitter (X) Developer account and the following libraries:
 # - tweepy
-# - requests
+# - httpx with HTTP/2 support (for the Gemini API and web scraping)
 # - beautifulsoup4 (for web scraping)
-# - pandas
+# - lxml (fast HTML parser used by beautifulsoup4)
+# - orjson (fast JSON encoding/decoding)
 # - python-dotenv
 #
 # ====================================================================
@@ -16,31 +17,33 @@
 # Open your terminal or command prompt and run the following command
 # to install the necessary libraries:
 #
-# pip install tweepy requests beautifulsoup4 pandas python-dotenv
+# pip install tweepy "httpx[http2]" beautifulsoup4 lxml orjson python-dotenv
 #
 # ====================================================================
 # STEP 2: The Python Script
 # ====================================================================
 
+import argparse
+import hashlib
 import os
 import random
-import requests
-import json
-import tweepy
-import pandas as pd
+import re
+import httpx
+import orjson
 import time
+from pathlib import Path
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
+from dispatch import load_schedule, save_schedule
 
 # ---
 # 1. Configuration
 # ---
 
-# IMPORTANT: Use the full, absolute path to the .env.local file.
-# This ensures the script can find the file regardless of the current working directory.
-ENV_PATH = '/home/vlad/Desktop/twitter-bot/.env.local'
+# The .env.local file is looked up next to this script, so the bot can be
+# started from any working directory (cron, systemd, containers).
+ENV_PATH = Path(__file__).resolve().parent / ".env.local"
 
-if os.path.exists(ENV_PATH):
+if ENV_PATH.exists():
     print(f"Loading environment variables from: {ENV_PATH}")
     load_dotenv(ENV_PATH)
 else:
@@ -77,7 +80,7 @@ if not all([X_BEARER_TOKEN, X_API_KEY, X_API_SECRET, X_ACCESS_TOKEN, X_ACCESS_SE
 
 # A more diverse and engaging list of topics the bot can tweet about.
 # The bot will select one of these topics randomly.
-TOPICS = [
+TOPICS = (
     "tech trends",
     "fullstack development",
     "AI ethics",
@@ -92,50 +95,221 @@ TOPICS = [
     "open source projects",
     "tech career advice",
     "software engineering best practices"
-]
+)
+
+# Topics that may come with a daily.dev article link.
+LINK_TOPICS = frozenset(("tech", "fullstack development", "AI"))
+
+# Tweet languages and their cumulative weights (67% English, 33% Romanian).
+LANGUAGES = ("en", "ro")
+LANGUAGE_CUM_WEIGHTS = (67, 100)
+
+TWEET_TYPES = ("standard", "fun_fact", "hot_take")
+
+# Prompt templates for every (language, tweet type) combination. Each one
+# starts with the persona for the language and ends with the instructions for
+# the tweet type.
+PROMPT_INTROS = {
+    "en": """
+    You are a friendly, engaging, and knowledgeable tech enthusiast.
+    Your task is to write a single tweet (maximum 280 characters) about the following topic:
+    "{topic}".
+    
+    The tweet should be:
+    - Concise and to the point.
+    - Engaging and conversational.
+    - Use relevant hashtags.
+    - Sound like it was written by a human.
+    """,
+    "ro": """
+        Ești un pasionat de tehnologie, prietenos, antrenant și informat.
+        Sarcina ta este să scrii un singur tweet (maximum 280 de caractere) despre următorul subiect:
+        "{topic}".
+        
+        Tweet-ul ar trebui să fie:
+        - Concis și direct la subiect.
+        - Antrenant și conversațional.
+        - Să folosească hashtag-uri relevante.
+        - Să sune ca și cum ar fi fost scris de o persoană.
+        """,
+}
+
+TWEET_TYPE_INSTRUCTIONS = {
+    ("en", "standard"): "",
+    ("en", "fun_fact"): "\n\nStart the tweet with 'Fun Fact:' or 'Did you know?' and present a surprising or interesting fact about the topic.",
+    ("en", "hot_take"): "\n\nStart the tweet with a strong, opinionated statement (a 'hot take') about the topic that is likely to spark debate. Use an emoji to signal the opinion.",
+    ("ro", "standard"): "",
+    ("ro", "fun_fact"): "\n\nÎncepe tweet-ul cu 'Un fapt interesant:' sau 'Știai că?' și prezintă un fapt surprinzător sau interesant despre subiect.",
+    ("ro", "hot_take"): "\n\nÎncepe tweet-ul cu o declarație fermă, bazată pe opinie (un 'hot take') despre subiect, care să stârnească o dezbatere. Folosește un emoji pentru a semnala opinia.",
+}
+
+PROMPT_TEMPLATES = {
+    (language, tweet_type): PROMPT_INTROS[language] + instructions
+    for (language, tweet_type), instructions in TWEET_TYPE_INSTRUCTIONS.items()
+}
+
+# Every prompt for the known topics, fully rendered at import time so only the
+# optional link has to be added per tweet.
+PROMPTS = {
+    (language, tweet_type, topic): template.format(topic=topic)
+    for (language, tweet_type), template in PROMPT_TEMPLATES.items()
+    for topic in TOPICS
+}
+
+# Wraps the per-tweet prompts when several tweets are generated in one request.
+TWEET_SEPARATOR = "<<<TWEET>>>"
+# Matches the "--- Tweet N ---" header the batch prompt puts before each tweet's
+# instructions, in case Gemini echoes it back.
+TWEET_HEADER_PATTERN = re.compile(r"^\s*--- Tweet \d+ ---\s*")
+BATCH_PROMPT_INTRO = """
+You will write {count} separate tweets, one for each set of instructions below.
+Reply with only the tweets, in the same order, separated by a line containing only {separator}.
+"""
+
+# Appended to the prompt when a link should be included in the tweet.
+LINK_INSTRUCTIONS = {
+    "en": "\n\nInclude this link at the end of the tweet, after the content and hashtags: {link}",
+    "ro": "\n\nInclude acest link la finalul tweet-ului, după conținut și hashtag-uri: {link}",
+}
 
 # The Gemini model to use for text generation.
 GEMINI_MODEL = "gemini-2.5-flash-preview-05-20"
 
+# The only part of the Gemini response the bot reads. Google APIs trim the
+# response body down to these fields server-side.
+GEMINI_RESPONSE_FIELDS = "candidates.content.parts.text"
+
+# The random number generator behind every choice the bot makes. Pass --seed
+# on the command line to make a run reproducible.
+RNG = random.Random()
+
+# A single HTTP/2 client shared by the daily.dev scraper and the Gemini calls.
+# Reusing it keeps connections alive instead of paying a new TCP + TLS
+# handshake for every request, and HTTP/2 multiplexes requests to the same
+# host over one connection.
+HTTP = httpx.Client(http2=True, timeout=30.0, follow_redirects=True)
+
+# The Twitter (X) client, built on first use by get_twitter_client() and then
+# reused so its HTTP connection to the API is shared across tweets.
+_twitter_client = None
+
+# Generated tweets that were never posted are kept here for up to a day and
+# reused when the same kind of tweet comes up again, saving a Gemini call.
+TWEET_CACHE_PATH = ENV_PATH.parent / "tweet_cache.json"
+TWEET_CACHE_TTL = 24 * 60 * 60
+
+# Retry settings for transient API failures (rate limits, server errors, timeouts).
+MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 1
+RETRY_MAX_DELAY = 60
+
+# Don't wait longer than this for a Twitter (X) rate limit window to reset;
+# the 15-minute windows are fine, daily limits are not worth blocking on.
+RATE_LIMIT_MAX_WAIT = 15 * 60
+
 # ---
 # 2. Function Definitions
 # ---
 
-def get_article_from_daily_dev():
+# Article links scraped from daily.dev, fetched once and reused for the
+# rest of the run.
+_daily_dev_links = None
+
+def get_article_links_from_daily_dev():
     """
-    Scrapes the daily.dev homepage to find a relevant tech article to link.
+    Scrapes the daily.dev homepage once and returns every article link found.
+    Subsequent calls reuse the links from the first successful scrape.
 
     Returns:
-        str: A URL of a recent tech article, or None if an error occurs.
+        list: URLs of recent tech articles (empty if an error occurs).
     """
-    print("Scraping daily.dev for a relevant article...")
+    global _daily_dev_links
+    if _daily_dev_links is not None:
+        return _daily_dev_links
+
+    print("Scraping daily.dev for relevant articles...")
     url = "https://daily.dev"
     try:
-        response = requests.get(url, timeout=10)
+        response = HTTP.get(url, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Imported here so runs that never scrape don't pay for it.
+        from bs4 import BeautifulSoup
+        
+        # lxml is a C parser and much faster than the pure-Python 'html.parser'.
+        soup = BeautifulSoup(response.text, 'lxml')
         
         # Updated selector to be more robust.
         links = soup.select('div[data-testid="feed-article-card-link"] a[href]')
         
-        if links:
-            # Pick a random link from the found articles.
-            full_link = random.choice(links)['href']
-            print(f"Found article link: {full_link}")
-            return full_link
-        else:
-            print("No articles found on daily.dev with the specified selector.")
-            return None
+        _daily_dev_links = [link['href'] for link in links]
+        print(f"Found {len(_daily_dev_links)} article links.")
+        return _daily_dev_links
             
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Error scraping daily.dev: {e}")
+        return []
+
+def get_article_from_daily_dev():
+    """
+    Picks a relevant tech article from daily.dev to link.
+
+    Returns:
+        str: A URL of a recent tech article, or None if none is available.
+    """
+    links = get_article_links_from_daily_dev()
+    
+    if links:
+        # Pick a random link from the found articles.
+        full_link = RNG.choice(links)
+        print(f"Found article link: {full_link}")
+        return full_link
+    else:
+        print("No articles found on daily.dev with the specified selector.")
+        return None
+
+def backoff_delay(attempt):
+    """
+    Returns how long to wait before retrying a failed call: exponential backoff
+    capped at RETRY_MAX_DELAY, plus up to a second of random jitter.
+
+    Args:
+        attempt (int): The number of the attempt that just failed, starting at 0.
+
+    Returns:
+        float: The delay in seconds.
+    """
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) + RNG.uniform(0, 1)
+
+def is_transient_request_error(error):
+    """
+    Checks whether a failed HTTP request is worth retrying: connection errors,
+    timeouts, rate limits (429) and server errors (5xx).
+    """
+    if isinstance(error, httpx.TransportError):
+        return True
+    response = getattr(error, "response", None)
+    return response is not None and (response.status_code == 429 or response.status_code >= 500)
+
+def rate_limit_reset_delay(error):
+    """
+    Reads the x-rate-limit-reset header of a failed Twitter (X) API call.
+
+    Returns:
+        float: Seconds until the rate limit window resets, or None if unknown.
+    """
+    response = getattr(error, "response", None)
+    reset = response.headers.get("x-rate-limit-reset") if response is not None else None
+    if reset is None:
+        return None
+    try:
+        return max(0, int(reset) - time.time()) + 1
+    except ValueError:
         return None
 
-def generate_tweet_with_gemini(topic, tweet_type="standard", include_link=None, language="en"):
+def build_prompt(topic, tweet_type="standard", include_link=None, language="en"):
     """
-    Uses the Gemini API to generate a creative and engaging tweet.
-    This function can generate standard tweets, hot takes, or fun facts.
+    Builds the Gemini prompt for a single tweet.
 
     Args:
         topic (str): The subject for the tweet.
@@ -144,161 +318,337 @@ def generate_tweet_with_gemini(topic, tweet_type="standard", include_link=None,
         language (str): The language code for the tweet (e.g., 'en' for English, 'ro' for Romanian).
 
     Returns:
-        str: The generated tweet text, or None if an error occurs.
+        str: The prompt text.
     """
-    print(f"Generating a {tweet_type} tweet in {language} about: {topic}...")
+    prompt = PROMPTS.get((language, tweet_type, topic))
+    if prompt is None:
+        prompt = PROMPT_TEMPLATES[(language, tweet_type)].format(topic=topic)
+    if include_link:
+        prompt += LINK_INSTRUCTIONS[language].format(link=include_link)
+    return prompt
 
-    # Base prompt for the AI persona.
-    base_prompt = """
-    You are a friendly, engaging, and knowledgeable tech enthusiast.
-    Your task is to write a single tweet (maximum 280 characters) about the following topic:
-    "{topic}".
-    
-    The tweet should be:
-    - Concise and to the point.
-    - Engaging and conversational.
-    - Use relevant hashtags.
-    - Sound like it was written by a human.
+def generate_tweets_with_gemini(tweet_specs):
     """
+    Uses the Gemini API to generate several creative and engaging tweets in a
+    single request. Each tweet can be a standard tweet, a hot take, or a fun fact.
 
-    # Customize the prompt based on the tweet type.
-    if tweet_type == "fun_fact":
-        base_prompt += "\n\nStart the tweet with 'Fun Fact:' or 'Did you know?' and present a surprising or interesting fact about the topic."
-    elif tweet_type == "hot_take":
-        base_prompt += "\n\nStart the tweet with a strong, opinionated statement (a 'hot take') about the topic that is likely to spark debate. Use an emoji to signal the opinion."
-    
-    if include_link:
-        base_prompt += f"\n\nInclude this link at the end of the tweet, after the content and hashtags: {include_link}"
+    Args:
+        tweet_specs (list): One dict per tweet, with the 'topic', 'tweet_type',
+            'include_link' and 'language' arguments for build_prompt().
 
-    # Translate the prompt if the language is Romanian.
-    if language == "ro":
-        prompt_template = f"""
-        Ești un pasionat de tehnologie, prietenos, antrenant și informat.
-        Sarcina ta este să scrii un singur tweet (maximum 280 de caractere) despre următorul subiect:
-        "{topic}".
-        
-        Tweet-ul ar trebui să fie:
-        - Concis și direct la subiect.
-        - Antrenant și conversațional.
-        - Să folosească hashtag-uri relevante.
-        - Să sune ca și cum ar fi fost scris de o persoană.
-        """
-        if tweet_type == "fun_fact":
-            prompt_template += "\n\nÎncepe tweet-ul cu 'Un fapt interesant:' sau 'Știai că?' și prezintă un fapt surprinzător sau interesant despre subiect."
-        elif tweet_type == "hot_take":
-            prompt_template += "\n\nÎncepe tweet-ul cu o declarație fermă, bazată pe opinie (un 'hot take') despre subiect, care să stârnească o dezbatere. Folosește un emoji pentru a semnala opinia."
-        if include_link:
-            prompt_template += f"\n\nInclude acest link la finalul tweet-ului, după conținut și hashtag-uri: {link_to_include}"
-    else: # Default to English
-        prompt_template = base_prompt
+    Returns:
+        list: The generated tweet texts, in the order of tweet_specs, or an empty
+            list if an error occurs or Gemini returned a different number of
+            tweets than requested.
+    """
+    for spec in tweet_specs:
+        print(f"Generating a {spec['tweet_type']} tweet in {spec['language']} about: {spec['topic']}...")
+
+    prompt = BATCH_PROMPT_INTRO.format(count=len(tweet_specs), separator=TWEET_SEPARATOR)
+    for i, spec in enumerate(tweet_specs, start=1):
+        prompt += f"\n\n--- Tweet {i} ---\n{build_prompt(**spec)}"
 
     payload = {
-        "contents": [{"parts": [{"text": prompt_template}]}]
+        "contents": [{"parts": [{"text": prompt}]}]
     }
 
     api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_MODEL}:generateContent?key={GEMINI_API_KEY}"
     
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            response = HTTP.post(
+                api_url,
+                headers={
+                    "Content-Type": "application/json",
+                    # Only return the generated text, not safety ratings,
+                    # usage metadata, etc.
+                    "X-Goog-FieldMask": GEMINI_RESPONSE_FIELDS,
+                },
+                content=orjson.dumps(payload),
+                timeout=30 # Set a timeout of 30 seconds
+            )
+            response.raise_for_status()
+            break
+
+        except httpx.HTTPError as e:
+            if attempt == MAX_ATTEMPTS - 1 or not is_transient_request_error(e):
+                print(f"Error calling Gemini API: {e}")
+                return []
+            delay = backoff_delay(attempt)
+            print(f"Gemini API call failed ({e}). Retrying in {delay:.0f} seconds...")
+            time.sleep(delay)
+
     try:
-        response = requests.post(
-            api_url,
-            headers={"Content-Type": "application/json"},
-            data=json.dumps(payload),
-            timeout=30 # Set a timeout of 30 seconds
-        )
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        tweet_text = data.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text")
-        
-        if tweet_text:
-            return tweet_text.strip()
-        else:
-            print("Error: No tweet text found in the Gemini response.")
-            return None
-            
-    except requests.exceptions.RequestException as e:
-        print(f"Error calling Gemini API: {e}")
-        return None
-    except (KeyError, IndexError) as e:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
         print(f"Error parsing Gemini response: {e}")
-        return None
+        return []
+        
+    try:
+        tweet_text = data["candidates"][0]["content"]["parts"][0]["text"]
+    except (KeyError, IndexError, TypeError):
+        tweet_text = None
+    
+    if not tweet_text:
+        print("Error: No tweet text found in the Gemini response.")
+        return []
 
-def post_tweet(tweet_text):
+    tweets = [TWEET_HEADER_PATTERN.sub("", tweet).strip() for tweet in tweet_text.split(TWEET_SEPARATOR)]
+    tweets = [tweet for tweet in tweets if tweet]
+    if len(tweets) != len(tweet_specs):
+        # A preamble or merged tweets would be posted as-is, so drop the batch.
+        print(f"Error: Asked Gemini for {len(tweet_specs)} tweets but got {len(tweets)}. Discarding them.")
+        return []
+    return tweets
+
+def tweet_cache_key(topic, tweet_type="standard", include_link=None, language="en"):
     """
-    Posts a tweet to your Twitter (X) account using the Tweepy library.
+    Returns the tweet cache key for a tweet spec (the arguments for build_prompt()).
     """
-    print("Attempting to post the tweet...")
-    
+    raw_key = f"{topic}|{tweet_type}|{language}|{include_link or ''}"
+    return hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()
+
+def is_tweet_expired(created_at):
+    """
+    Checks whether a tweet generated at created_at is older than TWEET_CACHE_TTL.
+    """
+    return created_at <= time.time() - TWEET_CACHE_TTL
+
+def load_tweet_cache():
+    """
+    Reads the cache of unposted tweets, dropping entries older than TWEET_CACHE_TTL.
+
+    Returns:
+        dict: Maps each cache key to a list of {'text', 'created_at'} dicts.
+    """
+    fresh_cache = {}
     try:
-        client = tweepy.Client(
+        cache = orjson.loads(TWEET_CACHE_PATH.read_bytes())
+        for key, pool in cache.items():
+            pool = [entry for entry in pool if not is_tweet_expired(entry["created_at"])]
+            if pool:
+                fresh_cache[key] = pool
+    except (FileNotFoundError, orjson.JSONDecodeError, KeyError, TypeError, AttributeError):
+        # A missing or malformed cache file just means there is nothing to reuse.
+        return {}
+    return fresh_cache
+
+def save_tweet_cache(cache):
+    """
+    Writes the cache of unposted tweets.
+    """
+    TWEET_CACHE_PATH.write_bytes(orjson.dumps({key: pool for key, pool in cache.items() if pool}))
+
+def take_cached_tweet(cache, key):
+    """
+    Removes and returns a random cached tweet for the given key.
+    Tweets are taken out of the cache because X rejects duplicate posts, and
+    expired tweets are discarded.
+
+    Returns:
+        dict: The tweet's 'text' and 'created_at', or None if no unexpired tweet
+            is cached for the key.
+    """
+    pool = cache.get(key)
+    while pool:
+        entry = pool.pop(RNG.randrange(len(pool)))
+        if not is_tweet_expired(entry["created_at"]):
+            return entry
+    return None
+
+def put_cached_tweet(cache, key, tweet_text, created_at):
+    """
+    Adds an unposted tweet to the cache.
+
+    Args:
+        cache (dict): The cache from load_tweet_cache().
+        key (str): The tweet's cache key.
+        tweet_text (str): The tweet text.
+        created_at (float): When the tweet was generated, so it still expires
+            TWEET_CACHE_TTL after generation however often it is re-cached.
+    """
+    if is_tweet_expired(created_at):
+        return
+    cache.setdefault(key, []).append({"text": tweet_text, "created_at": created_at})
+
+def cache_unposted_tweet(key, tweet_text, created_at):
+    """
+    Puts a tweet that failed to post back into the on-disk cache so a later run
+    can reuse it instead of calling Gemini again. Does nothing without a key.
+    """
+    if not key:
+        return
+    cache = load_tweet_cache()
+    put_cached_tweet(cache, key, tweet_text, created_at)
+    save_tweet_cache(cache)
+
+def get_twitter_client():
+    """
+    Returns the shared Twitter (X) client, creating it on the first call.
+    tweepy is imported here so runs that never post don't pay for it.
+    """
+    global _twitter_client
+    if _twitter_client is None:
+        import tweepy
+        _twitter_client = tweepy.Client(
             bearer_token=X_BEARER_TOKEN,
             consumer_key=X_API_KEY,
             consumer_secret=X_API_SECRET,
             access_token=X_ACCESS_TOKEN,
             access_token_secret=X_ACCESS_SECRET
         )
-        
-        response = client.create_tweet(text=tweet_text)
-            
-        print("Tweet posted successfully!")
-        print(f"View it at: https://twitter.com/user/status/{response.data['id']}")
-        return True
+    return _twitter_client
+
+def post_tweet(tweet_text):
+    """
+    Posts a tweet to your Twitter (X) account using the Tweepy library.
+    Rate limits and server errors are retried with backoff; for rate limits,
+    when the API says when the window resets, the retry waits until then.
+    """
+    import tweepy
+
+    print("Attempting to post the tweet...")
     
-    except tweepy.errors.TweepyException as e:
-        print(f"Error posting tweet: {e}")
-        return False
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-        return False
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            response = get_twitter_client().create_tweet(text=tweet_text)
+                
+            print("Tweet posted successfully!")
+            print(f"View it at: https://twitter.com/user/status/{response.data['id']}")
+            return True
+
+        except tweepy.errors.TooManyRequests as e:
+            delay = rate_limit_reset_delay(e)
+            if delay is None:
+                delay = backoff_delay(attempt)
+            if attempt == MAX_ATTEMPTS - 1 or delay > RATE_LIMIT_MAX_WAIT:
+                print(f"Error posting tweet: {e}")
+                return False
+            print(f"Posting failed ({e}). Retrying in {delay:.0f} seconds...")
+            time.sleep(delay)
+
+        except tweepy.errors.TwitterServerError as e:
+            # X sends x-rate-limit-reset on every response, so server errors
+            # ignore it and always back off.
+            if attempt == MAX_ATTEMPTS - 1:
+                print(f"Error posting tweet: {e}")
+                return False
+            delay = backoff_delay(attempt)
+            print(f"Posting failed ({e}). Retrying in {delay:.0f} seconds...")
+            time.sleep(delay)
+        
+        except tweepy.errors.TweepyException as e:
+            print(f"Error posting tweet: {e}")
+            return False
+        except Exception as e:
+            print(f"An unexpected error occurred: {e}")
+            return False
 
 # ---
 # 3. Main Execution Logic
 # ---
 
+def choose_tweet_spec():
+    """
+    Picks a random language, tweet type and topic (plus an optional link) for one tweet.
+
+    Returns:
+        dict: The arguments for build_prompt().
+    """
+    # Determine language with a 33% chance for Romanian.
+    selected_language = RNG.choices(LANGUAGES, cum_weights=LANGUAGE_CUM_WEIGHTS, k=1)[0]
+    
+    # Choose a random tweet type.
+    tweet_type = RNG.choice(TWEET_TYPES)
+    
+    # Choose a random topic.
+    selected_topic = RNG.choice(TOPICS)
+    
+    # Get a link if the topic is tech and there's a 50% chance.
+    link_to_include = None
+    if selected_topic in LINK_TOPICS and RNG.random() < 0.5:
+        link_to_include = get_article_from_daily_dev()
+    
+    return {
+        "topic": selected_topic,
+        "tweet_type": tweet_type,
+        "include_link": link_to_include,
+        "language": selected_language,
+    }
+
 def run_bot():
     """
     Main function to run the bot.
+    Generates all of the day's tweets in one Gemini request (reusing cached,
+    unposted tweets where possible), posts the first one right away and
+    schedules the rest for dispatch.py, instead of keeping the process alive
+    between tweets. Tweets still pending from earlier runs stay scheduled.
     """
-    num_tweets = random.randint(0, 7)
+    num_tweets = RNG.randint(0, 7)
     print(f"Scheduled to post {num_tweets} tweets today.")
 
     if num_tweets == 0:
         print("No tweets scheduled for today. Exiting.")
         return
 
-    for i in range(num_tweets):
-        # Determine language with a 33% chance for Romanian.
-        selected_language = random.choices(["en", "ro"], weights=[67, 33], k=1)[0]
-        
-        # Choose a random tweet type.
-        tweet_type = random.choice(["standard", "fun_fact", "hot_take"])
-        
-        # Choose a random topic.
-        selected_topic = random.choice(TOPICS)
-        
-        # Get a link if the topic is tech and there's a 50% chance.
-        link_to_include = None
-        if selected_topic in ["tech", "fullstack development", "AI"] and random.random() < 0.5:
-            link_to_include = get_article_from_daily_dev()
-        
-        # Generate the tweet content.
-        tweet_content = generate_tweet_with_gemini(
-            selected_topic,
-            tweet_type=tweet_type,
-            include_link=link_to_include,
-            language=selected_language
-        )
-        
-        if tweet_content:
-            post_tweet(tweet_content)
+    # Reuse cached tweets where possible and only ask Gemini for the rest.
+    cache = load_tweet_cache()
+    tweet_specs = [choose_tweet_spec() for _ in range(num_tweets)]
+    cache_keys = [tweet_cache_key(**spec) for spec in tweet_specs]
+    tweets = []
+    uncached_specs = []
+    uncached_keys = []
+    for spec, key in zip(tweet_specs, cache_keys):
+        cached = take_cached_tweet(cache, key)
+        if cached:
+            tweets.append((key, cached))
         else:
-            print("Could not generate a tweet. Skipping this iteration.")
-        
-        if i < num_tweets - 1:
-            delay_in_seconds = random.randint(3600, 14400)
-            print(f"Tweet {i+1}/{num_tweets} posted. Waiting {delay_in_seconds // 60} minutes for the next one.")
-            time.sleep(delay_in_seconds)
+            uncached_specs.append(spec)
+            uncached_keys.append(key)
+    print(f"Reusing {len(tweets)} cached tweets.")
+
+    if uncached_specs:
+        generated = generate_tweets_with_gemini(uncached_specs)
+        created_at = time.time()
+        for key, tweet_text in zip(uncached_keys, generated):
+            tweets.append((key, {"text": tweet_text, "created_at": created_at}))
+    save_tweet_cache(cache)
+
+    if not tweets:
+        print("Could not generate any tweets. Exiting.")
+        return
+
+    # The first tweet goes out now; each later one 1-4 hours after the previous.
+    schedule = []
+    send_at = time.time()
+    for key, tweet in tweets[1:]:
+        send_at += RNG.randint(3600, 14400)
+        schedule.append({
+            "send_at": send_at,
+            "text": tweet["text"],
+            "cache_key": key,
+            "created_at": tweet["created_at"],
+        })
+    # Add to the tweets still pending from earlier runs rather than replacing
+    # them; a 7-tweet day can run past the next day's start.
+    pending = load_schedule()
+    if pending:
+        print(f"{len(pending)} tweets from earlier runs are still scheduled.")
+    save_schedule(pending + schedule)
+
+    for i, entry in enumerate(schedule, start=2):
+        print(f"Tweet {i}/{len(tweets)} scheduled for {time.ctime(entry['send_at'])}.")
+
+    first_key, first_tweet = tweets[0]
+    if not post_tweet(first_tweet["text"]):
+        cache_unposted_tweet(first_key, first_tweet["text"], first_tweet["created_at"])
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate, post and schedule today's tweets.")
+    parser.add_argument("--seed", type=int, help="Seed the random choices for a reproducible run.")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        RNG.seed(args.seed)
+
     run_bot()
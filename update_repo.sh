@@ -1,7 +1,7 @@
 #!/bin/bash
 
-# Navigate to the project directory
-cd /home/vlad/Desktop/twitter-bot/
+# Navigate to the project directory (the directory containing this script)
+cd "$(dirname "$0")"
 
 # Check the remote URL to ensure it's using SSH
 echo "Checking Git remote URL..."